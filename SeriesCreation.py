@@ -5,6 +5,9 @@ sys.path.append('/opt/anaconda3/envs/myenvtest/lib/python3.10/site-packages')
 from coffee.client import JsonApiClient
 from coffee.workflows import SeriesWorkflow
 
+# Columns SeriesWorkflow.bulk_link_series_to_component expects, in output order
+LINK_CSV_COLUMNS = ['name', 'process']
+
 
 def process_csv(uploaded_file):
     """
@@ -31,16 +34,17 @@ def trim_and_link_csv(uploaded_file):
     then use SeriesWorkflow to bulk_link_series_to_component.
     """
     try:
-        # Load the uploaded CSV file
-        df = pd.read_csv(uploaded_file)
-
-        # Keep only the 'name' and 'process' columns
-        if 'name' in df.columns and 'process' in df.columns:
-            trimmed_df = df[['name', 'process']]
-        else:
-            st.error("The CSV must contain 'name' and 'process' columns.")
+        # Check the header before parsing any rows
+        uploaded_file.seek(0)
+        columns = set(pd.read_csv(uploaded_file, nrows=0).columns)
+        if not columns.issuperset(LINK_CSV_COLUMNS):
+            st.error(f"The CSV must contain {' and '.join(map(repr, LINK_CSV_COLUMNS))} columns.")
             return
 
+        # Load only the link columns
+        uploaded_file.seek(0)
+        trimmed_df = pd.read_csv(uploaded_file, usecols=LINK_CSV_COLUMNS)[LINK_CSV_COLUMNS]
+
         # Save the trimmed data to a temporary file
         trimmed_file_path = "/tmp/trimmed_series.csv"
         trimmed_df.to_csv(trimmed_file_path, index=False)